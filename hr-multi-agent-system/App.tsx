@@ -1,12 +1,17 @@
 
-import React, { useState, useCallback, useEffect } from 'react';
+import React, { useState, useCallback, useEffect, lazy, Suspense } from 'react';
 import { Agent, CandidateContext } from './types';
 import { memoryService, CandidateRecord, WorkflowState } from './services/memoryService';
 import AgentSelector from './components/AgentSelector';
-import TalentScout from './components/TalentScout';
-import Onboarder from './components/Onboarder';
-import PolicyQA from './components/PolicyQA';
 import Manager from './components/Manager';
+import Spinner from './components/common/Spinner';
+import AgentErrorBoundary from './components/common/AgentErrorBoundary';
+
+// Manager is the landing view and only touches local storage. The Gemini-backed
+// agents are loaded on first use so the SDK isn't part of the initial bundle.
+const TalentScout = lazy(() => import('./components/TalentScout'));
+const Onboarder = lazy(() => import('./components/Onboarder'));
+const PolicyQA = lazy(() => import('./components/PolicyQA'));
 
 const App: React.FC = () => {
   const [activeAgent, setActiveAgent] = useState<Agent>(Agent.Manager);
@@ -85,21 +90,15 @@ const App: React.FC = () => {
     }
   };
 
-  const renderActiveAgent = () => {
-    switch (activeAgent) {
-      case Agent.Manager:
-        return <Manager onNavigateToAgent={handleNavigateToAgent} />;
-      case Agent.TalentScout:
-        return <TalentScout onHireCandidate={handleHireCandidate} currentCandidateId={currentCandidateId} />;
-      case Agent.Onboarder:
-        return <Onboarder candidate={candidateContext} currentCandidateId={currentCandidateId} />;
-      case Agent.PolicyQA:
-        return <PolicyQA currentCandidateId={currentCandidateId} />;
-      default:
-        return <Manager onNavigateToAgent={handleNavigateToAgent} />;
-    }
+  const agentViews: Record<Agent, () => React.ReactNode> = {
+    [Agent.Manager]: () => <Manager onNavigateToAgent={handleNavigateToAgent} />,
+    [Agent.TalentScout]: () => <TalentScout onHireCandidate={handleHireCandidate} currentCandidateId={currentCandidateId} />,
+    [Agent.Onboarder]: () => <Onboarder candidate={candidateContext} currentCandidateId={currentCandidateId} />,
+    [Agent.PolicyQA]: () => <PolicyQA currentCandidateId={currentCandidateId} />,
   };
 
+  const renderActiveAgent = () => (agentViews[activeAgent] ?? agentViews[Agent.Manager])();
+
   return (
     <div className="min-h-screen bg-slate-900 text-slate-200 font-sans flex flex-col items-center p-4 sm:p-6 lg:p-8">
       <div className="w-full max-w-5xl mx-auto">
@@ -113,7 +112,11 @@ const App: React.FC = () => {
         <main className="bg-slate-800/50 backdrop-blur-sm border border-slate-700 rounded-xl shadow-2xl shadow-slate-950/50 overflow-hidden">
           <AgentSelector activeAgent={activeAgent} setActiveAgent={handleNavigateToAgent} />
           <div className="p-6 sm:p-8">
-            {renderActiveAgent()}
+            <AgentErrorBoundary key={activeAgent} onBackToManager={() => handleNavigateToAgent(Agent.Manager)}>
+              <Suspense fallback={<div className="flex justify-center py-12"><Spinner /></div>}>
+                {renderActiveAgent()}
+              </Suspense>
+            </AgentErrorBoundary>
           </div>
         </main>
         <footer className="text-center mt-8 text-slate-500 text-sm">
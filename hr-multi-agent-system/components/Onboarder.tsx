@@ -1,6 +1,6 @@
 
 import React, { useState, useEffect, useCallback } from 'react';
-import { createOnboardingPlan } from '../services/geminiService';
+import { createOnboardingPlan, preloadGemini } from '../services/geminiService';
 import { memoryService, CandidateRecord } from '../services/memoryService';
 import { ValidationService } from '../services/validationService';
 import { CandidateContext } from '../types';
@@ -48,6 +48,10 @@ const Onboarder: React.FC<OnboarderProps> = ({ candidate, currentCandidateId })
     const [validationErrors, setValidationErrors] = useState<string[]>([]);
     const [retryCount, setRetryCount] = useState(0);
 
+    useEffect(() => {
+        preloadGemini();
+    }, []);
+
     useEffect(() => {
         if (candidate) {
             setName(candidate.name);
@@ -103,7 +107,7 @@ const Onboarder: React.FC<OnboarderProps> = ({ candidate, currentCandidateId })
         setPlan(null);
         
         try {
-            const generatedPlan = await createOnboardingPlan(name, role, team);
+            const generatedPlan = await createOnboardingPlan(name, role, team, setPlan);
             setPlan(generatedPlan);
             setRetryCount(0);
             
@@ -137,6 +141,7 @@ const Onboarder: React.FC<OnboarderProps> = ({ candidate, currentCandidateId })
             
         } catch (err) {
             const errorMessage = err instanceof Error ? err.message : 'An unknown error occurred.';
+            setPlan(null);
             setError(errorMessage);
             
             // Retry logic
@@ -1,7 +1,7 @@
 
 import React, { useState, useEffect, useRef, useCallback } from 'react';
 import type { Chat } from '@google/genai';
-import { createPolicyQAChat } from '../services/geminiService';
+import { createPolicyQAChat, preloadGemini } from '../services/geminiService';
 import { memoryService, ConversationHistory } from '../services/memoryService';
 import { ValidationService } from '../services/validationService';
 import type { ChatMessage } from '../types';
@@ -18,10 +18,29 @@ const PolicyQA: React.FC<PolicyQAProps> = ({ currentCandidateId }) => {
     const [loading, setLoading] = useState(false);
     const [error, setError] = useState<string | null>(null);
     const [validationWarnings, setValidationWarnings] = useState<string[]>([]);
+    const [chatError, setChatError] = useState<string | null>(null);
     const chatContainerRef = useRef<HTMLDivElement>(null);
+    // Bumped on every (re)connect and on unmount so stale chat sessions are dropped
+    const connectionRef = useRef(0);
+
+    const connectChat = useCallback(() => {
+        const connection = ++connectionRef.current;
+        setChat(null);
+        setChatError(null);
+        createPolicyQAChat()
+            .then(newChat => {
+                if (connection === connectionRef.current) setChat(newChat);
+            })
+            .catch(err => {
+                if (connection === connectionRef.current) {
+                    setChatError(err instanceof Error ? err.message : 'Failed to start policy chat.');
+                }
+            });
+    }, []);
 
     useEffect(() => {
-        setChat(createPolicyQAChat());
+        preloadGemini();
+        connectChat();
         
         // Load conversation history if available
         const conversations = memoryService.getConversationsByAgent('PolicyQA');
@@ -40,7 +59,11 @@ const PolicyQA: React.FC<PolicyQAProps> = ({ currentCandidateId }) => {
                 timestamp: new Date()
             }]);
         }
-    }, [currentCandidateId]);
+
+        return () => {
+            connectionRef.current++;
+        };
+    }, [currentCandidateId, connectChat]);
     
     useEffect(() => {
         chatContainerRef.current?.scrollTo(0, chatContainerRef.current.scrollHeight);
@@ -150,16 +173,25 @@ const PolicyQA: React.FC<PolicyQAProps> = ({ currentCandidateId }) => {
             
             {error && <div className="bg-red-900/50 border-t border-red-700 text-red-300 p-2 text-center text-sm">{error}</div>}
 
+            {chatError && (
+                <div className="bg-red-900/50 border-t border-red-700 text-red-300 p-2 text-center text-sm">
+                    {chatError}{' '}
+                    <button type="button" onClick={connectChat} className="underline font-semibold hover:text-red-200">
+                        Retry
+                    </button>
+                </div>
+            )}
+
             <form onSubmit={handleSubmit} className="flex items-center p-2 bg-slate-800 border-t border-slate-700 rounded-b-lg">
                 <input
                     type="text"
                     value={userInput}
                     onChange={(e) => setUserInput(e.target.value)}
-                    placeholder="Ask a policy question..."
+                    placeholder={chat ? "Ask a policy question..." : chatError ? "PolicyBot is unavailable" : "Connecting to PolicyBot..."}
                     className="flex-1 bg-slate-700 border-transparent focus:ring-2 focus:ring-indigo-500 focus:border-transparent rounded-md p-2 text-slate-200 transition"
-                    disabled={loading}
+                    disabled={loading || !chat}
                 />
-                <button type="submit" disabled={loading || !userInput.trim()} className="ml-2 bg-indigo-600 hover:bg-indigo-700 disabled:bg-slate-600 text-white font-bold py-2 px-4 rounded-md transition">
+                <button type="submit" disabled={loading || !chat || !userInput.trim()} className="ml-2 bg-indigo-600 hover:bg-indigo-700 disabled:bg-slate-600 text-white font-bold py-2 px-4 rounded-md transition">
                     Send
                 </button>
             </form>
@@ -1,9 +1,9 @@
 
 import React, { useState, useCallback, useEffect } from 'react';
-import { screenResume } from '../services/geminiService';
+import { screenResume, screenResumes, preloadGemini } from '../services/geminiService';
 import { memoryService, CandidateRecord } from '../services/memoryService';
 import { ValidationService } from '../services/validationService';
-import type { ScreeningResult, CandidateContext } from '../types';
+import type { ScreeningResult, CandidateContext, BatchScreeningOutcome } from '../types';
 import Spinner from './common/Spinner';
 
 interface TalentScoutProps {
@@ -20,9 +20,14 @@ const TalentScout: React.FC<TalentScoutProps> = ({ onHireCandidate, currentCandi
   const [validationErrors, setValidationErrors] = useState<string[]>([]);
   const [validationWarnings, setValidationWarnings] = useState<string[]>([]);
   const [retryCount, setRetryCount] = useState(0);
+  const [batchResults, setBatchResults] = useState<BatchScreeningOutcome[] | null>(null);
   
   const canSubmit = jobDescription.trim().length > 0 && resumeText.trim().length > 0 && validationErrors.length === 0;
 
+  useEffect(() => {
+    preloadGemini();
+  }, []);
+
   useEffect(() => {
     // Load existing candidate data if editing
     if (currentCandidateId) {
@@ -62,6 +67,7 @@ const TalentScout: React.FC<TalentScoutProps> = ({ onHireCandidate, currentCandi
     setLoading(true);
     setError(null);
     setResult(null);
+    setBatchResults(null);
 
     try {
       const screeningResult = await screenResume(jobDescription, resumeText);
@@ -100,8 +106,95 @@ const TalentScout: React.FC<TalentScoutProps> = ({ onHireCandidate, currentCandi
     }
   }, [jobDescription, resumeText, canSubmit, currentCandidateId, retryCount]);
   
+  const getRecommendationColor = (recommendation: ScreeningResult['recommendation']) => {
+    switch (recommendation) {
+      case 'STRONG_HIRE': return 'text-green-400';
+      case 'HIRE': return 'text-blue-400';
+      case 'CONSIDER': return 'text-yellow-400';
+      case 'NO_HIRE': return 'text-red-400';
+      default: return 'text-gray-400';
+    }
+  };
+
+  const handleBatchFiles = async (files: File[]) => {
+    const jobValidation = ValidationService.validateJobDescription(jobDescription);
+    if (!jobDescription.trim() || !jobValidation.isValid) {
+      setError('Enter a valid job description before uploading multiple resumes.');
+      return;
+    }
+
+    setLoading(true);
+    setError(null);
+    setResult(null);
+    setBatchResults(null);
+
+    try {
+      // Outcomes keep each file's upload position; files that fail to read or
+      // validate are reported in place alongside the screened ones
+      const outcomes: BatchScreeningOutcome[] = new Array(files.length);
+      const resumes: { label: string; text: string }[] = [];
+      const resumePositions: number[] = [];
+      for (const [position, file] of files.entries()) {
+        const fileValidation = ValidationService.validateFile(file);
+        if (!fileValidation.isValid) {
+          outcomes[position] = { label: file.name, error: fileValidation.errors.join(', ') };
+          continue;
+        }
+
+        let text: string;
+        try {
+          text = ValidationService.sanitizeText(await file.text());
+        } catch {
+          outcomes[position] = { label: file.name, error: 'Failed to read file.' };
+          continue;
+        }
+
+        const resumeValidation = ValidationService.validateResumeText(text);
+        if (!resumeValidation.isValid) {
+          outcomes[position] = { label: file.name, error: resumeValidation.errors.join(', ') };
+          continue;
+        }
+        resumes.push({ label: file.name, text });
+        resumePositions.push(position);
+      }
+
+      const screened = await screenResumes(jobDescription, resumes);
+      screened.forEach((outcome, index) => {
+        outcomes[resumePositions[index]] = outcome;
+      });
+
+      for (const outcome of screened) {
+        if (!outcome.result) continue;
+        const candidateRecord: CandidateRecord = {
+          id: memoryService.generateCandidateId(),
+          personalInfo: {
+            name: outcome.result.candidate_name,
+            role: outcome.result.role_applied_for
+          },
+          screeningResult: outcome.result,
+          status: 'screened',
+          createdAt: new Date(),
+          updatedAt: new Date()
+        };
+        memoryService.saveCandidateRecord(candidateRecord);
+      }
+      setBatchResults(outcomes);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'An unknown error occurred.');
+    } finally {
+      setLoading(false);
+    }
+  };
+
   const handleFileChange = (e: React.ChangeEvent<HTMLInputElement>) => {
-    const file = e.target.files?.[0];
+    const files = Array.from(e.target.files ?? []);
+    e.target.value = '';
+    if (files.length > 1) {
+      handleBatchFiles(files);
+      return;
+    }
+
+    const file = files[0];
     if (file) {
       // Validate file first
       const fileValidation = ValidationService.validateFile(file);
@@ -183,11 +276,11 @@ const TalentScout: React.FC<TalentScoutProps> = ({ onHireCandidate, currentCandi
            <div className="flex items-center space-x-2">
             <label
               htmlFor="resume-upload"
-              className="cursor-pointer bg-slate-700 hover:bg-slate-600 text-slate-200 font-semibold py-2 px-4 rounded-md transition duration-200 text-sm"
+              className={`bg-slate-700 text-slate-200 font-semibold py-2 px-4 rounded-md transition duration-200 text-sm ${loading ? 'opacity-50 cursor-not-allowed' : 'cursor-pointer hover:bg-slate-600'}`}
             >
-              Upload .txt file
+              Upload .txt file(s)
             </label>
-            <input id="resume-upload" type="file" accept=".txt" className="hidden" onChange={handleFileChange} />
+            <input id="resume-upload" type="file" accept=".txt" multiple className="hidden" disabled={loading} onChange={handleFileChange} />
             <span className="text-slate-500 text-sm">or paste below</span>
           </div>
           <textarea
@@ -212,6 +305,31 @@ const TalentScout: React.FC<TalentScoutProps> = ({ onHireCandidate, currentCandi
 
       {error && <div className="bg-red-900/50 border border-red-700 text-red-300 p-4 rounded-md">{error}</div>}
 
+      {batchResults && (
+        <div className="space-y-4 pt-4 border-t border-slate-700 animate-fade-in">
+          <h3 className="text-xl font-bold">Batch Screening Results</h3>
+          <p className="text-slate-400 text-sm">Screened candidates have been saved and can be reviewed from the Manager dashboard.</p>
+          <ul className="space-y-2">
+            {batchResults.map((outcome, index) => (
+              <li key={index} className="bg-slate-900/70 p-4 rounded-lg flex justify-between items-center gap-4">
+                <div>
+                  <p className="font-semibold">{outcome.result ? outcome.result.candidate_name : outcome.label}</p>
+                  <p className="text-slate-500 text-sm">{outcome.label}</p>
+                </div>
+                {outcome.result ? (
+                  <div className="text-right">
+                    <p className="text-lg font-bold">{outcome.result.match_score}<span className="text-sm text-slate-400">/100</span></p>
+                    <p className={`text-sm font-bold ${getRecommendationColor(outcome.result.recommendation)}`}>{outcome.result.recommendation.replace('_', ' ')}</p>
+                  </div>
+                ) : (
+                  <p className="text-red-300 text-sm">{outcome.error}</p>
+                )}
+              </li>
+            ))}
+          </ul>
+        </div>
+      )}
+
       {result && (
         <div className="space-y-4 pt-4 border-t border-slate-700 animate-fade-in">
           <h3 className="text-xl font-bold">Screening Result for {result.candidate_name}</h3>
@@ -0,0 +1,46 @@
+
+import React from 'react';
+
+interface AgentErrorBoundaryProps {
+  children: React.ReactNode;
+  onBackToManager: () => void;
+}
+
+interface AgentErrorBoundaryState {
+  error: Error | null;
+}
+
+// Keeps a failed agent view (e.g. a lazy chunk that fails to load) from
+// unmounting the whole app, so the selector and Manager stay usable.
+class AgentErrorBoundary extends React.Component<AgentErrorBoundaryProps, AgentErrorBoundaryState> {
+  state: AgentErrorBoundaryState = { error: null };
+
+  static getDerivedStateFromError(error: Error): AgentErrorBoundaryState {
+    return { error };
+  }
+
+  componentDidCatch(error: Error, info: React.ErrorInfo) {
+    console.error('Agent view failed to render:', error, info.componentStack);
+  }
+
+  render() {
+    if (this.state.error) {
+      return (
+        <div className="bg-red-900/50 border border-red-700 text-red-300 p-4 rounded-md space-y-3">
+          <p>This agent could not be loaded: {this.state.error.message}</p>
+          <p className="text-sm text-red-400">Check your connection and API key, then reload the page to try again.</p>
+          <button
+            onClick={this.props.onBackToManager}
+            className="bg-slate-700 hover:bg-slate-600 text-slate-200 font-semibold py-2 px-4 rounded-md transition duration-200 text-sm"
+          >
+            Back to Manager
+          </button>
+        </div>
+      );
+    }
+
+    return this.props.children;
+  }
+}
+
+export default AgentErrorBoundary;
@@ -1,14 +1,63 @@
 
-import { GoogleGenAI, Type, Chat } from "@google/genai";
-import type { ScreeningResult } from '../types';
+import type { GoogleGenAI, Chat } from "@google/genai";
+import type { ScreeningResult, BatchScreeningOutcome } from '../types';
 
 if (!process.env.API_KEY) {
     throw new Error("API_KEY environment variable not set");
 }
 
-const ai = new GoogleGenAI({ apiKey: process.env.API_KEY });
+type GenAISdk = typeof import("@google/genai");
 
-const screeningResultSchema = {
+let sdkPromise: Promise<GenAISdk> | null = null;
+let clientPromise: Promise<GoogleGenAI> | null = null;
+
+// The SDK is fetched separately from the view chunk, so a view renders before
+// the SDK arrives. A failed load is forgotten so the next retry can fetch it again.
+const loadSdk = (): Promise<GenAISdk> => {
+    if (!sdkPromise) {
+        sdkPromise = import("@google/genai").catch(error => {
+            sdkPromise = null;
+            throw error;
+        });
+    }
+    return sdkPromise;
+};
+
+const getClient = (): Promise<GoogleGenAI> => {
+    if (!clientPromise) {
+        clientPromise = loadSdk().then(({ GoogleGenAI }) => new GoogleGenAI({ apiKey: process.env.API_KEY }));
+        clientPromise.catch(() => {
+            clientPromise = null;
+        });
+    }
+    return clientPromise;
+};
+
+const GEMINI_API_ORIGIN = 'https://generativelanguage.googleapis.com';
+const PRECONNECT_LINK_ID = 'gemini-api-preconnect';
+
+// Browsers drop an unused preconnect after about 10s, so the hint is (re)issued
+// when a Gemini-backed view mounts rather than once at page load.
+const preconnectGeminiApi = (): void => {
+    document.getElementById(PRECONNECT_LINK_ID)?.remove();
+    const link = document.createElement('link');
+    link.id = PRECONNECT_LINK_ID;
+    link.rel = 'preconnect';
+    link.href = GEMINI_API_ORIGIN;
+    link.crossOrigin = 'anonymous';
+    document.head.appendChild(link);
+};
+
+// Called when a Gemini-backed view mounts, so the SDK download and API
+// handshake overlap with the user filling in the form.
+export const preloadGemini = (): void => {
+    preconnectGeminiApi();
+    getClient().catch(() => {
+        // A failed preload is retried by the first real request
+    });
+};
+
+const buildScreeningResultSchema = ({ Type }: GenAISdk) => ({
     type: Type.OBJECT,
     properties: {
         candidate_name: { type: Type.STRING, description: "The full name of the candidate found in the resume." },
@@ -21,13 +70,101 @@ const screeningResultSchema = {
         reasoning: { type: Type.STRING, description: "A short paragraph explaining the reasoning behind the recommendation." },
     },
     required: ["candidate_name", "role_applied_for", "match_score", "summary", "strengths", "weaknesses", "recommendation", "reasoning"],
+});
+
+// The schema is static once the SDK is loaded, so build it a single time.
+let screeningResultSchema: ReturnType<typeof buildScreeningResultSchema> | null = null;
+
+const getScreeningResultSchema = (sdk: GenAISdk) => {
+    if (!screeningResultSchema) {
+        screeningResultSchema = buildScreeningResultSchema(sdk);
+    }
+    return screeningResultSchema;
+};
+
+// Static role and instructions live in the system instruction, kept identical
+// across requests and separate from the per-request candidate data in contents.
+const SCREENING_SYSTEM_INSTRUCTION = `
+    **Role:** You are 'TalentScout', an expert AI recruiter.
+    **Task:** Analyze the provided resume against the job description and return a structured JSON analysis.
+
+    **Instructions:**
+    1.  Carefully read both the job description and the resume.
+    2.  Identify the candidate's name and the role they are being considered for.
+    3.  Evaluate the candidate's experience, skills, and qualifications against the requirements.
+    4.  Calculate a match score from 0-100.
+    5.  Summarize the key strengths and weaknesses.
+    6.  Provide a clear hiring recommendation ('STRONG_HIRE', 'HIRE', 'CONSIDER', 'NO_HIRE').
+    7.  Provide concise reasoning for your recommendation.
+    8.  Return the analysis in the specified JSON format.
+`;
+
+const ONBOARDING_SYSTEM_INSTRUCTION = `
+    **Role:** You are 'Onboarder', an expert HR specialist.
+    **Task:** Create a detailed and personalized 30-day onboarding plan for a new hire.
+
+    **Instructions:**
+    1.  Generate a comprehensive 30-day plan broken down into Week 1, Week 2, and Weeks 3-4.
+    2.  Include a mix of activities: company orientation, team introductions, technical setup, initial projects, and learning goals.
+    3.  Make the tone welcoming and professional.
+    4.  Format the output using Markdown for readability (e.g., use '#' for headings, '*' for bullet points).
+    5.  Include specific action items and deliverables for each week.
+    6.  Add checkpoints for manager check-ins and feedback sessions.
+`;
+
+// Identical resume/job description pairs that are being screened at the same
+// time share one request. Nothing is kept once it settles, so clicking Screen
+// again always produces a fresh analysis.
+const inFlightScreenings = new Map<string, Promise<ScreeningResult>>();
+
+const getScreeningKey = (jobDescription: string, resumeText: string): string =>
+    JSON.stringify([jobDescription.trim(), resumeText.trim()]);
+
+const MAX_RETRIES = 3;
+
+// Two-tier model policy for onboarding plans: the cheaper Flash-Lite model
+// drafts first, and a draft that fails isCompletePlan() is regenerated on Flash.
+// Screening and policy chat have no quality signal to escalate on, so they are
+// pinned to Flash.
+const ROUTINE_MODEL = "gemini-2.5-flash-lite";
+const ESCALATION_MODEL = "gemini-2.5-flash";
+const SCREENING_MODEL = "gemini-2.5-flash";
+const POLICY_QA_MODEL = "gemini-2.5-flash";
+
+// The onboarding instructions ask for Week 1, Week 2 and Weeks 3-4 sections
+const isCompletePlan = (plan: string): boolean =>
+    plan.trim().length >= 100 && /week\s*1\b/i.test(plan) && /week\s*2\b/i.test(plan) && /weeks?\s*3/i.test(plan);
+
+// Per-attempt retry logging is opt-in (HR_VERBOSE=1); the final failure is always logged.
+const VERBOSE = process.env.HR_VERBOSE === '1';
+
+// Plan drafting and grounded policy answers don't need thinking, so disable it
+// explicitly for whichever model tier serves them (Flash thinks by default).
+// Screening keeps the model's default thinking for the hiring judgement.
+const NO_THINKING = { thinkingBudget: 0 };
+
+// Shared retry loop with exponential backoff for every one-shot Gemini request.
+const withRetry = async <T>(label: string, failureMessage: string, request: () => Promise<T>): Promise<T> => {
+    for (let attempt = 0; ; attempt++) {
+        try {
+            return await request();
+        } catch (error) {
+            if (attempt >= MAX_RETRIES) {
+                console.error(`Error ${label}:`, error);
+                throw new Error(failureMessage);
+            }
+
+            if (VERBOSE) {
+                console.error(`Error ${label}:`, error);
+                console.log(`Retrying ${label}... (Attempt ${attempt + 1}/${MAX_RETRIES})`);
+            }
+            await new Promise(resolve => setTimeout(resolve, 1000 * Math.pow(2, attempt)));
+        }
+    }
 };
 
-export const screenResume = async (jobDescription: string, resumeText: string, retryCount = 0): Promise<ScreeningResult> => {
+const requestScreening = async (jobDescription: string, resumeText: string): Promise<ScreeningResult> => {
     const prompt = `
-        **Role:** You are 'TalentScout', an expert AI recruiter.
-        **Task:** Analyze the provided resume against the job description and return a structured JSON analysis.
-        
         **Job Description:**
         ---
         ${jobDescription}
@@ -37,123 +174,170 @@ export const screenResume = async (jobDescription: string, resumeText: string, r
         ---
         ${resumeText}
         ---
-
-        **Instructions:**
-        1.  Carefully read both the job description and the resume.
-        2.  Identify the candidate's name and the role they are being considered for.
-        3.  Evaluate the candidate's experience, skills, and qualifications against the requirements.
-        4.  Calculate a match score from 0-100.
-        5.  Summarize the key strengths and weaknesses.
-        6.  Provide a clear hiring recommendation ('STRONG_HIRE', 'HIRE', 'CONSIDER', 'NO_HIRE').
-        7.  Provide concise reasoning for your recommendation.
-        8.  Return the analysis in the specified JSON format.
     `;
-    
-    try {
+
+    return withRetry("screening resume", "Failed to get analysis from Gemini API after multiple attempts.", async () => {
+        const [ai, sdk] = await Promise.all([getClient(), loadSdk()]);
         const response = await ai.models.generateContent({
-            model: "gemini-2.5-flash",
+            model: SCREENING_MODEL,
             contents: prompt,
             config: {
+                systemInstruction: SCREENING_SYSTEM_INSTRUCTION,
                 responseMimeType: "application/json",
-                responseSchema: screeningResultSchema,
+                responseSchema: getScreeningResultSchema(sdk),
             },
         });
 
         const jsonText = response.text.trim();
-        const result = JSON.parse(jsonText) as ScreeningResult;
-        
+        const parsed = JSON.parse(jsonText) as ScreeningResult;
+
         // Validate the result
-        if (!result.candidate_name || !result.role_applied_for || typeof result.match_score !== 'number') {
+        if (!parsed.candidate_name || !parsed.role_applied_for || typeof parsed.match_score !== 'number') {
             throw new Error('Invalid API response format');
         }
-        
-        return result;
-    } catch (error) {
-        console.error("Error screening resume:", error);
-        
-        // Implement retry logic with exponential backoff
-        if (retryCount < 3) {
-            console.log(`Retrying API request... (Attempt ${retryCount + 1}/3)`);
-            await new Promise(resolve => setTimeout(resolve, 1000 * Math.pow(2, retryCount)));
-            return screenResume(jobDescription, resumeText, retryCount + 1);
-        }
-        
-        throw new Error("Failed to get analysis from Gemini API after multiple attempts.");
+
+        return parsed;
+    });
+};
+
+export const screenResume = (jobDescription: string, resumeText: string): Promise<ScreeningResult> => {
+    const key = getScreeningKey(jobDescription, resumeText);
+    const pending = inFlightScreenings.get(key);
+    if (pending) {
+        return pending;
     }
+
+    const request = requestScreening(jobDescription, resumeText).finally(() => {
+        inFlightScreenings.delete(key);
+    });
+    inFlightScreenings.set(key, request);
+    return request;
+};
+
+// Screens many resumes against one job description with a bounded pool of
+// concurrent requests. Outcomes are returned in input order; a failed resume
+// is reported in its outcome rather than failing the whole batch. Duplicate
+// resumes in a batch share one request, even when they aren't screened concurrently.
+export const screenResumes = async (
+    jobDescription: string,
+    resumes: { label: string; text: string }[],
+    concurrency = 4
+): Promise<BatchScreeningOutcome[]> => {
+    const outcomes: BatchScreeningOutcome[] = new Array(resumes.length);
+    const requests = new Map<string, Promise<ScreeningResult>>();
+    let next = 0;
+
+    const worker = async () => {
+        while (next < resumes.length) {
+            const index = next++;
+            const { label, text } = resumes[index];
+            const key = getScreeningKey(jobDescription, text);
+            let request = requests.get(key);
+            if (!request) {
+                request = screenResume(jobDescription, text);
+                requests.set(key, request);
+            }
+            try {
+                outcomes[index] = { label, result: await request };
+            } catch (error) {
+                outcomes[index] = { label, error: error instanceof Error ? error.message : 'An unknown error occurred.' };
+            }
+        }
+    };
+
+    await Promise.all(Array.from({ length: Math.min(concurrency, resumes.length) }, worker));
+    return outcomes;
 };
 
-export const createOnboardingPlan = async (name: string, role: string, team: string, retryCount = 0): Promise<string> => {
+// Streams the plan so the UI can render it while it is still being generated.
+// onProgress receives the full text so far; it is reset to '' when a draft
+// starts or an attempt fails so a rejected partial plan never stays on screen.
+export const createOnboardingPlan = async (
+    name: string,
+    role: string,
+    team: string,
+    onProgress?: (partialPlan: string) => void
+): Promise<string> => {
     const prompt = `
-        **Role:** You are 'Onboarder', an expert HR specialist.
-        **Task:** Create a detailed and personalized 30-day onboarding plan for a new hire.
-        
         **New Hire Details:**
         -   **Name:** ${name}
         -   **Role:** ${role}
         -   **Team:** ${team}
-
-        **Instructions:**
-        1.  Generate a comprehensive 30-day plan broken down into Week 1, Week 2, and Weeks 3-4.
-        2.  Include a mix of activities: company orientation, team introductions, technical setup, initial projects, and learning goals.
-        3.  Make the tone welcoming and professional.
-        4.  Format the output using Markdown for readability (e.g., use '#' for headings, '*' for bullet points).
-        5.  Include specific action items and deliverables for each week.
-        6.  Add checkpoints for manager check-ins and feedback sessions.
     `;
 
-    try {
-        const response = await ai.models.generateContent({
-            model: "gemini-2.5-flash",
+    const streamPlan = async (model: string): Promise<string> => {
+        const ai = await getClient();
+        const stream = await ai.models.generateContentStream({
+            model,
             contents: prompt,
+            config: {
+                systemInstruction: ONBOARDING_SYSTEM_INSTRUCTION,
+                thinkingConfig: NO_THINKING,
+            },
         });
-        
-        const plan = response.text;
-        if (!plan || plan.trim().length < 100) {
-            throw new Error('Generated plan is too short or empty');
+
+        let plan = '';
+        onProgress?.(plan);
+        for await (const chunk of stream) {
+            plan += chunk.text ?? '';
+            onProgress?.(plan);
         }
-        
         return plan;
-    } catch (error) {
-        console.error("Error creating onboarding plan:", error);
-        
-        // Retry logic
-        if (retryCount < 3) {
-            console.log(`Retrying onboarding plan generation... (Attempt ${retryCount + 1}/3)`);
-            await new Promise(resolve => setTimeout(resolve, 1000 * Math.pow(2, retryCount)));
-            return createOnboardingPlan(name, role, team, retryCount + 1);
+    };
+
+    return withRetry("creating onboarding plan", "Failed to generate onboarding plan from Gemini API after multiple attempts.", async () => {
+        try {
+            let plan = await streamPlan(ROUTINE_MODEL);
+            if (!isCompletePlan(plan)) {
+                plan = await streamPlan(ESCALATION_MODEL);
+            }
+
+            if (plan.trim().length < 100) {
+                throw new Error('Generated plan is too short or empty');
+            }
+
+            return plan;
+        } catch (error) {
+            onProgress?.('');
+            throw error;
         }
-        
-        throw new Error("Failed to generate onboarding plan from Gemini API after multiple attempts.");
-    }
+    });
 };
 
-export const createPolicyQAChat = (): Chat => {
-    const DUMMY_POLICY_DOCUMENT = `
-        **Company Policy Handbook**
+// The handbook and chat config are static, so build them once and share them
+// across every PolicyQA chat session instead of per createPolicyQAChat() call.
+const POLICY_DOCUMENT = `
+    **Company Policy Handbook**
 
-        **1. Work Hours:**
-        - Standard work hours are 9:00 AM to 5:00 PM, Monday to Friday.
-        - Flexible work arrangements may be available upon manager approval.
+    **1. Work Hours:**
+    - Standard work hours are 9:00 AM to 5:00 PM, Monday to Friday.
+    - Flexible work arrangements may be available upon manager approval.
 
-        **2. Paid Time Off (PTO):**
-        - Full-time employees accrue 15 days of PTO per year for the first 2 years.
-        - After 2 years, PTO accrual increases to 20 days per year.
-        - PTO requests must be submitted through the HR portal at least 2 weeks in advance.
+    **2. Paid Time Off (PTO):**
+    - Full-time employees accrue 15 days of PTO per year for the first 2 years.
+    - After 2 years, PTO accrual increases to 20 days per year.
+    - PTO requests must be submitted through the HR portal at least 2 weeks in advance.
 
-        **3. Remote Work:**
-        - The company supports a hybrid work model.
-        - Employees are expected to be in the office at least 3 days a week.
-        - Specific in-office days are determined by individual teams.
+    **3. Remote Work:**
+    - The company supports a hybrid work model.
+    - Employees are expected to be in the office at least 3 days a week.
+    - Specific in-office days are determined by individual teams.
 
-        **4. Code of Conduct:**
-        - All employees are expected to maintain a professional and respectful work environment.
-        - Harassment and discrimination of any kind are not tolerated.
-    `;
+    **4. Code of Conduct:**
+    - All employees are expected to maintain a professional and respectful work environment.
+    - Harassment and discrimination of any kind are not tolerated.
+`;
 
-    return ai.chats.create({
-        model: 'gemini-2.5-flash',
-        config: {
-            systemInstruction: `You are 'PolicyBot', a helpful HR assistant. Your role is to answer questions based *only* on the provided Company Policy Handbook. If the answer is not in the handbook, state that you do not have that information and recommend contacting a human HR representative. Do not invent information. Here is the handbook: \n\n${DUMMY_POLICY_DOCUMENT}`,
-        },
-    });
+const POLICY_QA_CHAT_CONFIG = {
+    model: POLICY_QA_MODEL,
+    config: {
+        systemInstruction: `You are 'PolicyBot', a helpful HR assistant. Your role is to answer questions based *only* on the provided Company Policy Handbook. If the answer is not in the handbook, state that you do not have that information and recommend contacting a human HR representative. Do not invent information. Here is the handbook: \n\n${POLICY_DOCUMENT}`,
+        thinkingConfig: NO_THINKING,
+    },
 };
+
+export const createPolicyQAChat = (): Promise<Chat> =>
+    withRetry("starting policy chat", "Failed to start policy chat. Please check your connection.", async () => {
+        const ai = await getClient();
+        return ai.chats.create(POLICY_QA_CHAT_CONFIG);
+    });
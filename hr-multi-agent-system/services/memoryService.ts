@@ -31,6 +31,27 @@ class MemoryService {
   private readonly CONVERSATIONS_KEY = 'hr_conversations';
   private readonly SESSION_KEY = 'hr_session';
 
+  // Parsed copies of list-valued keys, reused while the stored JSON is unchanged
+  private readonly parsedCache = new Map<string, { raw: string; items: any[] }>();
+
+  private readList<T>(key: string, revive: (item: any) => T): T[] {
+    const stored = localStorage.getItem(key);
+    if (!stored) return [];
+
+    const cached = this.parsedCache.get(key);
+    if (cached && cached.raw === stored) {
+      return [...cached.items];
+    }
+
+    try {
+      const items = JSON.parse(stored).map(revive);
+      this.parsedCache.set(key, { raw: stored, items });
+      return [...items];
+    } catch {
+      return [];
+    }
+  }
+
   // Candidate Management
   saveCandidateRecord(candidate: CandidateRecord): void {
     const candidates = this.getAllCandidates();
@@ -53,18 +74,11 @@ class MemoryService {
   }
 
   getAllCandidates(): CandidateRecord[] {
-    const stored = localStorage.getItem(this.CANDIDATES_KEY);
-    if (!stored) return [];
-    
-    try {
-      return JSON.parse(stored).map((c: any) => ({
-        ...c,
-        createdAt: new Date(c.createdAt),
-        updatedAt: new Date(c.updatedAt)
-      }));
-    } catch {
-      return [];
-    }
+    return this.readList(this.CANDIDATES_KEY, (c: any) => ({
+      ...c,
+      createdAt: new Date(c.createdAt),
+      updatedAt: new Date(c.updatedAt)
+    }));
   }
 
   deleteCandidateRecord(id: string): void {
@@ -106,17 +120,10 @@ class MemoryService {
   }
 
   getAllConversations(): ConversationHistory[] {
-    const stored = localStorage.getItem(this.CONVERSATIONS_KEY);
-    if (!stored) return [];
-    
-    try {
-      return JSON.parse(stored).map((c: any) => ({
-        ...c,
-        timestamp: new Date(c.timestamp)
-      }));
-    } catch {
-      return [];
-    }
+    return this.readList(this.CONVERSATIONS_KEY, (c: any) => ({
+      ...c,
+      timestamp: new Date(c.timestamp)
+    }));
   }
 
   getConversationsByCandidate(candidateId: string): ConversationHistory[] {
@@ -17,6 +17,12 @@ export interface ScreeningResult {
   reasoning: string;
 }
 
+export interface BatchScreeningOutcome {
+  label: string;
+  result?: ScreeningResult;
+  error?: string;
+}
+
 export interface CandidateContext {
     name: string;
     role: string;